@@ -0,0 +1,77 @@
+# cython: language_level=3
+"""
+Optional compiled fast path for the packet framing helpers.
+
+Mirrors pack_data/unpack_data from rajant_api.helper_functions; keep the two
+implementations in sync. helper_functions imports these compiled versions when
+the extension has been built (Cython is an optional build dependency) and
+silently keeps the pure-Python definitions otherwise.
+"""
+
+from struct import Struct
+
+try:
+    from isal.isal_zlib import compress, decompress, error as zlib_error
+    _ZLIB_MAX_LEVEL = 3  # ISA-L exposes levels 0-3
+except ImportError:
+    from zlib import compress, decompress, error as zlib_error
+    _ZLIB_MAX_LEVEL = 9
+
+_HEADER_STRUCT = Struct('>ibbbb')
+_header_unpack_from = _HEADER_STRUCT.unpack_from
+_HDR_TAIL_GZIP = b'\x02\x00\x00\x00'
+_HDR_TAIL_RAW = b'\x00\x00\x00\x00'
+_COMPRESSION_MIN_SIZE = 64
+
+
+cpdef bytes pack_data(data, bint gzip=False, int compression_level=1):
+    """
+    Pack the given data into a binary packet with an optional gzip compression.
+    """
+    if not isinstance(data, bytes):
+        raise ValueError("data must be of type 'bytes'")
+    if gzip and len(data) < _COMPRESSION_MIN_SIZE:
+        gzip = False
+    if gzip:
+        try:
+            data = compress(data, min(compression_level, _ZLIB_MAX_LEVEL))
+        except zlib_error:
+            raise ValueError("Failed to compress data")
+    return len(data).to_bytes(4, 'big', signed=True) + (_HDR_TAIL_GZIP if gzip else _HDR_TAIL_RAW) + data
+
+
+cpdef bytes unpack_data(packet):
+    """
+    Unpack the data from a binary packet, possibly decompressing if gzip-compressed.
+    """
+    if not isinstance(packet, (bytes, bytearray, memoryview)):
+        raise ValueError("Input must be bytes.")
+    if len(packet) < 8:
+        raise ValueError("Input must be at least 8 bytes long.")
+
+    header = _header_unpack_from(packet, 0)
+
+    if header[0] != len(packet) - 8:
+        raise ValueError(f"Declared length {header[0]} does not match payload length {len(packet) - 8}")
+
+    data = memoryview(packet)[8:]
+
+    if header[1] == 2:
+        try:
+            data = decompress(data)
+        except zlib_error:
+            raise ValueError("Failed to decompress data")
+    elif header[1] != 0:
+        raise ValueError(f"Unknown compression flag: {header[1]}")
+
+    return data if isinstance(data, bytes) else bytes(data)
+
+
+cpdef list unpack_many(packets):
+    """
+    Unpacks a batch of binary packets in one call.
+    """
+    cdef list results = []
+    for packet in packets:
+        results.append(unpack_data(packet))
+    return results
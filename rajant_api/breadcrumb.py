@@ -0,0 +1,497 @@
+from rajant_api import Message_pb2
+from rajant_api.helper_functions import pack_data, unpack_data, is_host_reachable, _HEADER_STRUCT, _HDR_TAIL_RAW
+from socket import socket, AF_INET
+import asyncio
+import ssl
+from google.protobuf.message import DecodeError
+
+# Everything expected to go wrong while talking to a radio: socket and SSL
+# failures (ssl.SSLError subclasses OSError), malformed packets from
+# unpack_data (ValueError) and undecodable protobuf payloads.
+_TRANSPORT_ERRORS = (OSError, ValueError, KeyError, DecodeError)
+
+# Shared client context, built once instead of per connection as the
+# deprecated ssl.wrap_socket did. Breadcrumb radios present self-signed
+# certificates, so verification stays off to match the old defaults.
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX.check_hostname = False
+_SSL_CTX.verify_mode = ssl.CERT_NONE
+
+# Cache of (password bytes, challenge) -> SHA-384 digest, so a supervisor that
+# reauthenticates against the same radios does not rehash identical input.
+# Bounded to keep memory flat on long-running processes.
+_login_cache = {}
+_LOGIN_CACHE_MAX = 256
+
+
+class Breadcrumb:
+    """
+    A class used to represent a Breadcrumb.
+
+    This class holds the state and functionality for connecting, authenticating,
+    and interacting with a host via a specific role. It maintains a dictionary of actions,
+    roles and statuses.
+
+    Attributes:
+    host (str): The hostname or IP address of the target host.
+    port (int): The port number to connect to at the target host.
+    role (str): The role to use for interacting with the host.
+    password (str): The password to use for authenticating the role.
+    connection: Placeholder for a connection object. Initially set to None.
+    serial: Placeholder for a serial number. Initially set to None.
+    seq_number (int): The sequence number for actions sent to the host. Initially set to 0.
+    actions (dict): A dictionary mapping action names to values, extracted from Message_pb2.BCMessage.Auth.Action.
+    roles (dict): A dictionary mapping role names to values, extracted from Message_pb2.Common__pb2.Role.
+    authenticated (bool): A flag indicating whether the Breadcrumb is currently authenticated. Initially set to False.
+    statuses (dict): A dictionary mapping status codes to names, extracted from Message_pb2.BCMessage.Result.Status.
+    """
+
+    # These mappings come from generated protobuf descriptors and never change
+    # at runtime, so they are built once at class creation rather than per
+    # instance. The instance attributes below simply alias them.
+    _ACTIONS = dict(Message_pb2.BCMessage.Auth.Action.items())
+    _ROLES = dict(Message_pb2.Common__pb2.Role.items())
+    _STATUSES = {v: k for k, v in Message_pb2.BCMessage.Result.Status.items()}
+
+    def __init__(self, *, host=None, port=None, role=None, password=None):
+        """
+        Constructs a new Breadcrumb instance.
+
+        The parameters are all optional and each defaults to None if not provided.
+
+        Parameters:
+        host (str, optional): The hostname or IP address of the target host.
+        port (int, optional): The port number to connect to at the target host.
+        role (str, optional): The role to use for interacting with the host.
+        password (str, optional): The password to use for authenticating the role.
+        """
+        self.host = host
+        self.port = port
+        self.role = role
+        self.password = password
+        self.password_bytes = password.encode('latin1') if password else b''
+        self.connection = None
+        self.serial = None
+        self.seq_number = 0
+        # Receive buffer reused across get_message calls to avoid allocating
+        # a fresh 64 KiB bytes object per message.
+        self._rx_buf = bytearray(65535)
+        self._rx_view = memoryview(self._rx_buf)
+        # BCMessage instances reused across calls; protobuf message
+        # construction walks every field descriptor, so Clear() is cheaper
+        # than building a new message per request/response.
+        self._tx_msg = Message_pb2.BCMessage()
+        self._rx_msg = Message_pb2.BCMessage()
+        # TLS session from the last handshake, offered back to the radio on
+        # reconnect so resumption can skip the asymmetric key exchange.
+        self._ssl_session = None
+        self.actions = self._ACTIONS
+        self.roles = self._ROLES
+        self.authenticated = False
+        self.statuses = self._STATUSES
+
+    def reachable(self):
+        """
+        Checks if the host associated with this Breadcrumb instance is reachable.
+
+        This method uses the is_host_reachable function to attempt a TCP connection
+        to the host's BCAPI port and determines reachability based on whether the
+        connection was accepted.
+
+        Returns:
+        bool: True if the host accepted the connection, False otherwise.
+        """
+        if self.port is not None:
+            return is_host_reachable(self.host, self.port)
+        return is_host_reachable(self.host)
+
+    def get_message(self):
+        """
+        Retrieves and parses a message from the host associated with this Breadcrumb instance.
+
+        This method receives bytes from the host via the current connection into a
+        reusable buffer, unpacks the data, and parses it into a BCMessage object
+        (as defined in Message_pb2). The method also increments the sequence number
+        attribute after parsing the message.
+
+        The 8-byte header is read first, then exactly the payload length it
+        declares, so a message split across TCP segments (or larger than one
+        recv) is reassembled instead of being silently truncated.
+
+        The returned message is a reused instance: it remains valid only until the
+        next get_message call on this Breadcrumb, which clears and refills it.
+
+        Returns:
+        Message_pb2.BCMessage: The parsed message from the host.
+
+        Raises:
+        An exception will be raised if there's a problem receiving or parsing the data.
+        """
+        message = self._rx_msg
+        message.Clear()
+        self._recv_exact(self._rx_view[:8])
+        length = _HEADER_STRUCT.unpack_from(self._rx_buf, 0)[0]
+        if length < 0:
+            raise ValueError(f"Invalid payload length in header: {length}")
+        if 8 + length <= len(self._rx_buf):
+            # payload fits in the reusable receive buffer
+            self._recv_exact(self._rx_view[8:8 + length])
+            packet = self._rx_view[:8 + length]
+        else:
+            packet = bytearray(8 + length)
+            packet[:8] = self._rx_view[:8]
+            self._recv_exact(memoryview(packet)[8:])
+        message.ParseFromString(unpack_data(packet))
+        self.seq_number += 1
+        return message
+
+    def _recv_exact(self, view):
+        """
+        Fills the given memoryview completely from the connection, looping over
+        recv_into until every byte has arrived.
+
+        Raises:
+        ConnectionError: If the peer closes the connection mid-message.
+        """
+        offset = 0
+        size = len(view)
+        while offset < size:
+            received = self.connection.recv_into(view[offset:])
+            if received == 0:
+                raise ConnectionError("Connection closed while receiving message")
+            offset += received
+
+    def build_message(self):
+        """
+        Constructs a new BCMessage object with a sequence number.
+
+        This method clears the reused outgoing BCMessage object (as defined in Message_pb2)
+        and sets its sequence number to the current sequence number of this Breadcrumb instance.
+
+        The returned message is a reused instance: populate and send it before the
+        next build_message call on this Breadcrumb, which clears it again.
+
+        Returns:
+        Message_pb2.BCMessage: The cleared, sequence-numbered BCMessage object.
+        """
+        message = self._tx_msg
+        message.Clear()
+        message.sequenceNumber = self.seq_number
+        return message
+
+    def send_message(self, message, gzip=False):
+        """
+        Sends a message to the host associated with this Breadcrumb instance.
+
+        This method serializes the provided BCMessage object (as defined in Message_pb2),
+        prepends the packet header (optionally compressing the payload with gzip first),
+        and sends it to the host via the current connection with sendall, so large
+        packets are never silently truncated by a partial write. The method also increments the sequence
+        number attribute after sending the message.
+
+        Parameters:
+        message (Message_pb2.BCMessage): The message to be sent to the host.
+        gzip (bool, optional): A flag indicating whether to compress the serialized data with gzip before sending it. Defaults to False.
+
+        Raises:
+        An exception will be raised if there's a problem packing or sending the data.
+        """
+        if gzip:
+            tx_packet = pack_data(message.SerializeToString(), gzip=True)
+            self.connection.sendall(tx_packet)
+        elif not isinstance(self.connection, ssl.SSLSocket):
+            # plain socket: let the kernel gather header and payload, no
+            # userspace concatenation (SSL sockets do not support sendmsg)
+            payload = message.SerializeToString()
+            header = len(payload).to_bytes(4, 'big', signed=True) + _HDR_TAIL_RAW
+            sent = self.connection.sendmsg([header, payload])
+            if sent < 8 + len(payload):
+                # finish any partial scatter-gather write
+                self.connection.sendall((header + payload)[sent:])
+        else:
+            payload = message.SerializeToString()
+            tx_packet = len(payload).to_bytes(4, 'big', signed=True) + _HDR_TAIL_RAW + payload
+            self.connection.sendall(tx_packet)
+        self.seq_number += 1
+
+    def setup_connection_socket(self):
+        """
+        Sets up a secure socket connection to the host associated with this Breadcrumb instance.
+
+        This method creates a new INET socket, sets a timeout of 2 seconds on the socket,
+        wraps it in an SSL layer using the shared module-level context, and connects it
+        to the host at the specified port. The TLS session from the handshake is kept
+        so that reconnects can resume it instead of negotiating from scratch.
+
+        Raises:
+        socket.error: If a socket error occurs.
+        ssl.SSLError: If an SSL error occurs.
+        """
+        soc = socket(AF_INET)
+        soc.settimeout(2)
+        self.connection = _SSL_CTX.wrap_socket(soc, session=self._ssl_session)
+        self.connection.connect((self.host, self.port))
+        self._ssl_session = self.connection.session
+
+    def prepare_login_message(self, init_message):
+        """
+        Prepares a login message to authenticate with the host.
+
+        This method builds a new BCMessage object with a sequence number, sets its action to "LOGIN",
+        and its role to the Breadcrumb instance's role. It then computes a response hash from the
+        password and the challenge received from the host (found in the provided init_message), and
+        sets the response hash as the challengeOrResponse in the message. The compressionMask is set to 2.
+
+        Parameters:
+        init_message (Message_pb2.BCMessage): The initial message from the host, used to extract the challenge for response.
+
+        Returns:
+        Message_pb2.BCMessage: The prepared login message ready to be sent to the host.
+        """
+        # deferred so importing the package does not pay for hashlib unless
+        # a login actually happens; sys.modules makes repeat imports free
+        import hashlib
+
+        # Create message to login and set the login role
+        tx_message = self.build_message()
+        tx_message.auth.action = self.actions["LOGIN"]
+        tx_message.auth.role = self.roles[self.role]
+        # hash response (password + challenge received from radio) incrementally,
+        # feeding the challenge bytes straight in without a latin1 round trip;
+        # repeated logins with the same credentials hit the digest cache
+        cache_key = (self.password_bytes, init_message.auth.challengeOrResponse)
+        digest = _login_cache.get(cache_key)
+        if digest is None:
+            response_hash = hashlib.sha384(self.password_bytes)
+            response_hash.update(init_message.auth.challengeOrResponse)
+            digest = response_hash.digest()
+            if len(_login_cache) >= _LOGIN_CACHE_MAX:
+                _login_cache.pop(next(iter(_login_cache)))
+            _login_cache[cache_key] = digest
+        # set challengeOrResponse
+        tx_message.auth.challengeOrResponse = digest
+        tx_message.auth.compressionMask = 0 | 2
+        return tx_message
+
+    def authenticate(self):
+        """
+        Authenticates with the host associated with this Breadcrumb instance.
+
+        This method sets up a socket connection, receives an initial message, and extracts the
+        serial number. It then prepares and sends a login message, receives a result, and checks
+        if the authentication was successful. A host that is down simply fails the connect within
+        the socket timeout, which is cheaper than probing reachability up front.
+
+        In case of an error during this process, the method safely returns the current authentication status.
+
+        Returns:
+        bool: True if the authentication process was successful, False otherwise.
+        """
+        try:
+            self.setup_connection_socket()
+            init_message = self.get_message()
+            self.serial = str(init_message.auth.serial)
+            self.send_message(self.prepare_login_message(init_message))
+            status = self.statuses[self.get_message().authResult.status]
+
+            if status == 'SUCCESS':
+                self.authenticated = True
+                return self.authenticated
+
+            return self.authenticated
+        except _TRANSPORT_ERRORS:
+            return self.authenticated
+
+    def get_state(self):
+        """
+        Retrieves the state from the host associated with this Breadcrumb instance.
+
+        This method first ensures the Breadcrumb instance is authenticated, authenticating if
+        necessary. It then sends a request for the state, receives a response, and returns the
+        state extracted from the response. Reachability is not probed separately: a dead host
+        surfaces as a connect or receive failure within the socket timeout.
+
+        If the Breadcrumb instance cannot authenticate, or if an error occurs during the process,
+        it returns False.
+
+        Returns:
+        Message_pb2.BCMessage.State or bool: The state from the host if successful, False otherwise.
+        """
+        if not self.authenticated:
+            self.authenticate()
+
+        if self.authenticated and self.connection is not None:
+            try:
+                request_state_message = self.build_message()
+                request_state_message.state.Clear()
+                self.send_message(request_state_message)
+                response_message = self.get_message()
+                return response_message.state
+            except _TRANSPORT_ERRORS:
+                return False
+        else:
+            return False
+
+    def get_state_filter(self, filters):
+        """
+        Retrieves the state from the host associated with this Breadcrumb instance,
+        filtered by the provided filters.
+
+        This method first ensures the Breadcrumb instance is authenticated, authenticating if
+        necessary. It then appends the filters to the stateFilterPath of the request message,
+        sends a request for the state, receives a response, and returns the state extracted
+        from the response.
+
+        If the Breadcrumb instance cannot authenticate, or if an error occurs during the process,
+        it either raises the exception or returns False.
+
+        Parameters:
+        filters (list): A list of filters to apply when requesting the state.
+
+        Returns:
+        Message_pb2.BCMessage.State or bool: The state from the host if successful, False otherwise.
+
+        Raises:
+        Exception: If any error occurs during the process, it will be raised.
+        """
+        if not self.authenticated:
+            self.authenticate()
+
+        if self.authenticated and self.connection is not None:
+            try:
+                request_state_message = self.build_message()
+                request_state_message.state.Clear()
+                request_state_message.stateFilterPath.append(filters)
+                self.send_message(request_state_message)
+                response_message = self.get_message()
+                return response_message.state
+            except Exception as e:
+                raise e
+        else:
+            return False
+
+
+class AsyncBreadcrumb(Breadcrumb):
+    """
+    An asyncio variant of Breadcrumb for polling many radios concurrently.
+
+    The message construction and login logic are inherited from Breadcrumb;
+    only the transport is replaced with an asyncio stream, so N radios can be
+    polled on one event loop with their network waits overlapped:
+
+        results = await asyncio.gather(*(bc.get_state_async() for bc in bcs))
+
+    Unlike the synchronous class, the receive path reads exactly one framed
+    packet at a time (header first, then the declared payload length), so
+    messages split across TCP segments are reassembled correctly.
+    """
+
+    def __init__(self, *, host=None, port=None, role=None, password=None):
+        super().__init__(host=host, port=port, role=role, password=password)
+        self._reader = None
+        self._writer = None
+
+    async def setup_connection_async(self):
+        """
+        Opens an asyncio stream connection to the host over TLS.
+
+        Uses the shared module-level SSL context and the same 2-second timeout
+        as the synchronous socket setup.
+
+        Raises:
+        OSError: If the connection fails.
+        asyncio.TimeoutError: If the connection is not established in time.
+        """
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=_SSL_CTX), timeout=2)
+
+    async def get_message_async(self):
+        """
+        Reads and parses exactly one framed message from the stream.
+
+        The 8-byte header is read first, then exactly the declared payload
+        length, so short reads and coalesced packets are handled correctly.
+        As with get_message, the returned message is a reused instance valid
+        until the next call.
+
+        Returns:
+        Message_pb2.BCMessage: The parsed message from the host.
+        """
+        header = await self._reader.readexactly(8)
+        length = _HEADER_STRUCT.unpack_from(header, 0)[0]
+        body = await self._reader.readexactly(length)
+        message = self._rx_msg
+        message.Clear()
+        message.ParseFromString(unpack_data(header + body))
+        self.seq_number += 1
+        return message
+
+    async def send_message_async(self, message, gzip=False):
+        """
+        Serializes, packs and sends a message over the stream.
+
+        Parameters:
+        message (Message_pb2.BCMessage): The message to be sent to the host.
+        gzip (bool, optional): Whether to compress the payload. Defaults to False.
+        """
+        self._writer.write(pack_data(message.SerializeToString(), gzip=gzip))
+        await self._writer.drain()
+        self.seq_number += 1
+
+    async def authenticate_async(self):
+        """
+        Authenticates with the host over the asyncio stream.
+
+        Mirrors Breadcrumb.authenticate: connect, read the challenge, send the
+        login message and check the result status.
+
+        Returns:
+        bool: True if the authentication process was successful, False otherwise.
+        """
+        try:
+            await self.setup_connection_async()
+            init_message = await self.get_message_async()
+            self.serial = str(init_message.auth.serial)
+            await self.send_message_async(self.prepare_login_message(init_message))
+            result_message = await self.get_message_async()
+            status = self.statuses[result_message.authResult.status]
+
+            if status == 'SUCCESS':
+                self.authenticated = True
+            return self.authenticated
+        except _TRANSPORT_ERRORS + (EOFError, asyncio.TimeoutError):
+            return self.authenticated
+
+    async def get_state_async(self):
+        """
+        Retrieves the state from the host over the asyncio stream.
+
+        Mirrors Breadcrumb.get_state, authenticating first if necessary.
+
+        Returns:
+        Message_pb2.BCMessage.State or bool: The state from the host if successful, False otherwise.
+        """
+        if not self.authenticated:
+            await self.authenticate_async()
+
+        if self.authenticated and self._writer is not None:
+            try:
+                request_state_message = self.build_message()
+                request_state_message.state.Clear()
+                await self.send_message_async(request_state_message)
+                response_message = await self.get_message_async()
+                return response_message.state
+            except _TRANSPORT_ERRORS + (EOFError, asyncio.TimeoutError):
+                return False
+        else:
+            return False
+
+    async def close_async(self):
+        """
+        Closes the stream connection, if one is open.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._reader = None
+            self._writer = None
@@ -5,24 +5,34 @@ logger = logging.getLogger(__name__)
 
 #     IP Address Utilities     #
 
-import ipaddress
-
 
 def is_valid_ipv4(address):
     """
     Checks if a string is a valid IPv4 address.
 
+    Validates dotted-quad notation directly rather than constructing an
+    ipaddress.IPv4Address, which raises (and catches) an exception for every
+    invalid input. Like IPv4Address, octets with leading zeros are rejected.
+
     Parameters:
     address (str): The string to check.
 
     Returns:
     bool: True if the string is a valid IPv4 address, False otherwise.
     """
-    try:
-        ipaddress.IPv4Address(str(address))
-        return True
-    except (ipaddress.AddressValueError, ValueError):
+    if not isinstance(address, str):
         return False
+    parts = address.split('.')
+    if len(parts) != 4:
+        return False
+    for part in parts:
+        if not part.isascii() or not part.isdigit() or len(part) > 3:
+            return False
+        if part[0] == '0' and len(part) > 1:
+            return False
+        if int(part) > 255:
+            return False
+    return True
 
 
 ################################
@@ -30,53 +40,161 @@ def is_valid_ipv4(address):
 
 #     TCP Packet Formation     #
 
-from struct import pack, unpack, error as struct_error
-from zlib import decompress, compress, error as zlib_error
+from struct import Struct, error as struct_error
+
+try:
+    # Optional SIMD-accelerated zlib from Intel ISA-L; same API and wire
+    # format as stdlib zlib, typically 2-5x faster on deflate/inflate.
+    from isal.isal_zlib import compress, decompressobj, error as zlib_error
+    _ZLIB_MAX_LEVEL = 3  # ISA-L exposes levels 0-3
+except ImportError:
+    from zlib import compress, decompressobj, error as zlib_error
+    _ZLIB_MAX_LEVEL = 9
+
+try:
+    # Optional libdeflate bindings, the fastest backend for the one-shot
+    # whole-buffer (de)compression this module does. Emits and consumes the
+    # same zlib stream format, so the wire protocol is unchanged.
+    import deflate as _libdeflate
+except ImportError:
+    _libdeflate = None
+
+if _libdeflate is not None:
+    _compression_errors = (zlib_error, _libdeflate.DeflateError)
+else:
+    _compression_errors = (zlib_error,)
 
+# Initial output allocation for decompression. Received packets are capped at
+# 64 KiB, so 256 KiB covers typical deflate ratios without reallocating.
+_INFLATE_CHUNK_SIZE = 262144
 
-def pack_data(data, gzip=False):
+
+def _inflate(data):
+    """
+    Decompress zlib-wrapped data via a decompressobj with a preset output size,
+    avoiding zlib's internal grow-and-reallocate cycle for the common case.
+
+    The decompressobj is created per call by necessity: Python's zlib bindings
+    tie each object to a single stream and expose no inflateReset, so a cached
+    per-thread object cannot be reused across packets.
+    """
+    decomp = decompressobj()
+    chunks = [decomp.decompress(data, _INFLATE_CHUNK_SIZE)]
+    while decomp.unconsumed_tail:
+        chunks.append(decomp.decompress(decomp.unconsumed_tail, _INFLATE_CHUNK_SIZE))
+    chunks.append(decomp.flush())
+    return b''.join(chunks)
+
+# Packet header: 4-byte payload length followed by a compression flag and
+# three reserved bytes. Compiled once so the format string is not re-parsed
+# on every packet; used on the receive side, where unpack_from beats
+# int.from_bytes. On the send side the reverse is true, so headers are built
+# from int.to_bytes plus one of the invariant tails below.
+_HEADER_STRUCT = Struct('>ibbbb')
+_HDR_TAIL_GZIP = b'\x02\x00\x00\x00'
+_HDR_TAIL_RAW = b'\x00\x00\x00\x00'
+
+# Below this size the zlib header, Adler-32 trailer and stream setup cost more
+# than compression saves, so such payloads are sent uncompressed (flag 0,
+# which every receiver already handles).
+_COMPRESSION_MIN_SIZE = 64
+
+
+def pack_data(data, gzip=False, compression_level=1):
     """
     Pack the given data into a binary packet with an optional gzip compression.
+
+    compression_level defaults to 1: for the small, structured telemetry
+    payloads this protocol carries, level 1 is several times faster than the
+    zlib default of 6 at a marginal ratio cost. Pass a higher level (up to 9)
+    for bulk transfers where size matters more than latency.
     """
     if not isinstance(data, bytes):
         raise ValueError("data must be of type 'bytes'")
+    if gzip and len(data) < _COMPRESSION_MIN_SIZE:
+        gzip = False
     if gzip:
         try:
-            data = compress(data)
-        except zlib_error:
+            if _libdeflate is not None:
+                data = _libdeflate.zlib_compress(data, compression_level)
+            else:
+                data = compress(data, min(compression_level, _ZLIB_MAX_LEVEL))
+        except _compression_errors:
             raise ValueError("Failed to compress data")
-    header = pack('>ibbbb', len(data), 2 if gzip else 0, 0, 0, 0)
-    packet = header + data
-    return packet
+    return len(data).to_bytes(4, 'big', signed=True) + (_HDR_TAIL_GZIP if gzip else _HDR_TAIL_RAW) + data
 
 
 def unpack_data(packet):
     """
     Unpack the data from a binary packet, possibly decompressing if gzip-compressed.
+
+    The packet may be any bytes-like object (bytes, bytearray or memoryview),
+    allowing callers to pass reused receive buffers without copying.
     """
-    if not isinstance(packet, bytes):
+    if not isinstance(packet, (bytes, bytearray, memoryview)):
         raise ValueError("Input must be bytes.")
     if len(packet) < 8:
         raise ValueError("Input must be at least 8 bytes long.")
 
-
-
     try:
-        header = unpack('>ibbbb', packet[:8])
+        header = _HEADER_STRUCT.unpack_from(packet, 0)
     except struct_error:
         raise ValueError("Failed to unpack header")
 
-    data = packet[8:]
+    # reject malformed packets in O(1) before the decompressor chews on them
+    if header[0] != len(packet) - 8:
+        raise ValueError(f"Declared length {header[0]} does not match payload length {len(packet) - 8}")
 
+    # O(1) memoryview sub-range instead of copying the payload out of the
+    # packet before it is even decompressed
+    data = memoryview(packet)[8:]
+
+    # Flag 2 is a zlib-wrapped stream (2-byte header + Adler-32 trailer) as
+    # produced by the radios themselves; switching to raw DEFLATE would save
+    # 6 bytes per packet but break compatibility with deployed BCAPI peers.
     if header[1] == 2:
         try:
-            data = decompress(data)
-        except zlib_error:
+            if _libdeflate is not None:
+                try:
+                    data = _libdeflate.zlib_decompress(data, _INFLATE_CHUNK_SIZE)
+                except _libdeflate.DeflateError:
+                    # output exceeded the preset bound; fall back to the
+                    # streaming inflate, which can grow without limit
+                    data = _inflate(data)
+            else:
+                data = _inflate(data)
+        except _compression_errors:
             raise ValueError("Failed to decompress data")
     elif header[1] != 0:
         raise ValueError(f"Unknown compression flag: {header[1]}")
 
-    return data
+    return data if isinstance(data, bytes) else bytes(data)
+
+
+def unpack_many(packets):
+    """
+    Unpacks a batch of binary packets in one call.
+
+    Useful when packets arrive in bursts over TCP: the per-call dispatch is
+    amortized across the batch, and under the compiled fast path the whole
+    loop runs in the extension.
+
+    Parameters:
+    packets (iterable): An iterable of binary packets as accepted by unpack_data.
+
+    Returns:
+    list: A list with the unpacked payload of each packet, in order.
+    """
+    return [unpack_data(packet) for packet in packets]
+
+
+# Prefer the compiled framing helpers when the optional Cython extension has
+# been built; the pure-Python definitions above remain the reference
+# implementation and the fallback.
+try:
+    from rajant_api._fastpath import pack_data, unpack_data, unpack_many  # noqa: F811
+except ImportError:
+    pass
 
 
 ################################
@@ -84,6 +202,19 @@ def unpack_data(packet):
 
 #       bcapi helpers          #
 
+import re
+from operator import attrgetter
+
+# NMEA-style "DDMM.mmmm" coordinates with an optional hemisphere letter,
+# compiled once: integer degrees, fractional minutes, hemisphere.
+_LAT_RE = re.compile(r'(\d{2})(\d{2}\.\d+)([NS])?')
+_LON_RE = re.compile(r'(\d{3})(\d{2}\.\d+)([EW])?')
+
+# Resolves all three dotted paths in one C-level call instead of a chain of
+# LOAD_ATTR opcodes (and hasattr double lookups) per sample.
+_GPS_FIELDS = attrgetter('gps.gpsSwitch.enabled', 'gps.gpsPos.gpsLat', 'gps.gpsPos.gpsLong')
+
+
 def get_gps(state):
     """
     Extracts and processes GPS data from the provided state object.
@@ -94,6 +225,11 @@ def get_gps(state):
 
     If the GPS switch is not enabled in the state object, the function will return 0 for both latitude and longitude.
 
+    The raw values follow the NMEA "DDMM.mmmm" convention with an optional trailing
+    hemisphere letter (N/S for latitude, E/W for longitude). When the letter is
+    present, it determines the sign; when it is absent, the historical assumption
+    of a southern/eastern position is kept.
+
     Parameters:
     state (object): An object that contains GPS data. The structure of this object is assumed to be as follows:
                     - state.gps.gpsSwitch.enabled: A boolean indicating if the GPS is enabled.
@@ -103,22 +239,26 @@ def get_gps(state):
     Returns:
     dict: A dictionary with the following keys:
           - 'enabled': A boolean indicating whether the GPS was enabled.
-          - 'latitude': The latitude in degrees. It's negative, as values are assumed to be in the southern hemisphere.
-          - 'longitude': The longitude in degrees.
+          - 'latitude': The latitude in degrees, signed by hemisphere.
+          - 'longitude': The longitude in degrees, signed by hemisphere.
     """
     try:
-        if hasattr(state, "gps") and hasattr(state.gps, "gpsSwitch") and state.gps.gpsSwitch.enabled:
-            # get degrees
-            lat_deg = float(state.gps.gpsPos.gpsLat[0:2])
-            lon_deg = float(state.gps.gpsPos.gpsLong[0:3])
-            # get minutes
-            lat_min = float(state.gps.gpsPos.gpsLat[2:9])
-            lon_min = float(state.gps.gpsPos.gpsLong[3:10])
+        enabled, lat_raw, lon_raw = _GPS_FIELDS(state)
+        if enabled:
+            lat_match = _LAT_RE.match(lat_raw)
+            lon_match = _LON_RE.match(lon_raw)
+            if lat_match is None or lon_match is None:
+                logger.error("The GPS data did not match the expected DDMM.mmmm format.")
+                return None
+            # integer degrees plus fractional minutes, signed by hemisphere
+            # (defaulting to S/E when the letter is absent)
+            latitude = int(lat_match.group(1)) + float(lat_match.group(2)) / 60
+            longitude = int(lon_match.group(1)) + float(lon_match.group(2)) / 60
             # create dictionary to return
             return {
                 'enabled': True,
-                'latitude': -1 * (lat_deg + (lat_min / 60)),
-                'longitude': lon_deg + (lon_min / 60)
+                'latitude': -latitude if (lat_match.group(3) or 'S') == 'S' else latitude,
+                'longitude': -longitude if lon_match.group(3) == 'W' else longitude
             }
         else:
             return {
@@ -137,45 +277,106 @@ def get_gps(state):
         return None
 
 
+def get_gps_batch(states):
+    """
+    Extracts and processes GPS data from an iterable of state objects.
+
+    Convenience wrapper around get_gps for converting a batch of state
+    snapshots (e.g. one per radio in a mesh) in a single call.
+
+    Parameters:
+    states (iterable): An iterable of state objects as accepted by get_gps.
+
+    Returns:
+    list: A list with one get_gps result (dict or None) per state, in order.
+    """
+    return [get_gps(state) for state in states]
+
+
 ################################
 
 
 #      Connectivity Helpers      #
 
-import platform
-import subprocess
+import socket
+
+# Default BCAPI port on Rajant Breadcrumb radios.
+DEFAULT_BCAPI_PORT = 2300
 
 
-def is_host_reachable(host):
+def is_host_reachable(host, port=DEFAULT_BCAPI_PORT, timeout=0.5):
     """
-    Checks if a host is reachable by sending a single ICMP echo request ("ping") to the host.
+    Checks if a host is reachable by attempting a TCP connection to the given port.
+
+    A plain connect costs one syscall round trip, unlike the previous approach of
+    forking an external ping process, and tests the condition callers actually care
+    about: whether the BCAPI port accepts a connection.
 
     Parameters:
     host (str): The hostname or IP address of the target host.
+    port (int, optional): The TCP port to probe. Defaults to the BCAPI port 2300.
+    timeout (float, optional): Connection timeout in seconds. Defaults to 0.5.
 
     Returns:
-    bool: True if the host is reachable (the ping command was successful), False otherwise.
+    bool: True if the host accepted the connection, False otherwise.
 
     Raises:
     ValueError: If host is not a valid IPv4 address.
-    Exception: If an unexpected error occurs.
     """
 
     if not is_valid_ipv4(host):
         raise ValueError('Host must be a valid IPv4 address')
 
-    if platform.system().lower() == "windows":
-        cmd = ["ping", "-n", "1", host]
-    else:
-        cmd = ["ping", "-c", "1", host]
-
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.settimeout(timeout)
     try:
-        subprocess.check_output(cmd, stderr=subprocess.STDOUT, universal_newlines=True)
+        probe.connect((host, port))
         return True
-    except subprocess.CalledProcessError:
+    except OSError:
         return False
-    except Exception as e:
-        logger.exception("An unexpected error occurred")
-        raise
+    finally:
+        probe.close()
+
+
+async def are_hosts_reachable(hosts, port=DEFAULT_BCAPI_PORT, timeout=0.5):
+    """
+    Checks reachability of many hosts concurrently on one event loop.
+
+    Each host gets the same TCP connection probe as is_host_reachable, but the
+    probes run in parallel via asyncio, so checking a whole mesh takes roughly
+    one timeout instead of one per host.
+
+    Parameters:
+    hosts (iterable): The IPv4 addresses of the target hosts.
+    port (int, optional): The TCP port to probe. Defaults to the BCAPI port 2300.
+    timeout (float, optional): Connection timeout in seconds per host. Defaults to 0.5.
+
+    Returns:
+    dict: A mapping of each host to True if it accepted the connection, False otherwise.
+
+    Raises:
+    ValueError: If any host is not a valid IPv4 address.
+    """
+    import asyncio
+
+    hosts = list(hosts)
+    for host in hosts:
+        if not is_valid_ipv4(host):
+            raise ValueError('Host must be a valid IPv4 address')
+
+    async def probe(host):
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
+
+    results = await asyncio.gather(*(probe(host) for host in hosts))
+    return dict(zip(hosts, results))
 
 #######################################
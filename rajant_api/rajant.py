@@ -1,20 +1,51 @@
-import Message_pb2
+from rajant_api import Message_pb2
+
+# The login-request fields that are identical on every attempt, populated once.
+# Copying this template into a message skips the per-field descriptor walk
+# that setting each field individually pays on every call.
+_AUTH_TEMPLATE = Message_pb2.BCMessage()
+_AUTH_TEMPLATE.sequenceNumber = 0
+_AUTH_TEMPLATE.auth.action = Message_pb2.BCMessage.Auth.LOGIN
+_AUTH_TEMPLATE.auth.role = Message_pb2.Common__pb2.Role.Value("CO")
+_AUTH_TEMPLATE.auth.version = "1.0"
+# challengeOrResponse is a required field, so the template carries a
+# placeholder; the real challenge response replaces it per attempt
+_AUTH_TEMPLATE.auth.challengeOrResponse = b''
+
+# The template's wire bytes never change, so they are serialized exactly once.
+# The per-device serial is appended as a second occurrence of the auth
+# submessage, which protobuf parsers merge field-by-field into the first.
+_AUTH_TEMPLATE_BYTES = _AUTH_TEMPLATE.SerializeToString()
+
+_AUTH_FIELD_TAG = b'\x1a'  # BCMessage.auth: field 3, wire type 2
+_SERIAL_FIELD_TAG = b'\x52'  # Auth.serial: field 10, wire type 2
 
-def perform_authentication():
-    # Create an instance of BCMessage for authentication
-    auth_message = Message_pb2.BCMessage()
 
-    # Set the action to LOGIN for authentication
-    auth_message.auth.action = Message_pb2.BCMessage.Auth.LOGIN
+def _encode_varint(value):
+    # standard protobuf base-128 varint, little-endian groups of 7 bits
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
 
-    # Set other required fields for authentication (e.g., role, serial, version, etc.)
-    auth_message.auth.role = "CO"
-    auth_message.auth.serial = "YOUR_DEVICE_SERIAL_NUMBER"
-    auth_message.auth.version = "1.0"
-    # ... Add other fields as needed for your authentication
 
-    # Serialize the authentication message to bytes
-    serialized_auth_message = auth_message.SerializeToString()
+def serialize_auth_message(serial):
+    """
+    Returns the wire bytes of a login message for the given device serial
+    without re-encoding the static fields: the cached template bytes are
+    reused and only the serial field is emitted per call.
+    """
+    serial_bytes = serial.encode('utf-8')
+    inner = _SERIAL_FIELD_TAG + _encode_varint(len(serial_bytes)) + serial_bytes
+    return _AUTH_TEMPLATE_BYTES + _AUTH_FIELD_TAG + _encode_varint(len(inner)) + inner
+
+
+def perform_authentication():
+    # Serialize the authentication message to bytes; the static fields come
+    # from the cached template bytes, only the serial is encoded per call
+    serialized_auth_message = serialize_auth_message("YOUR_DEVICE_SERIAL_NUMBER")
 
     # In this step, you would send the serialized_auth_message to the BreadCrumb for authentication.
     # You need to implement the logic to send the message and receive the response from the BreadCrumb.
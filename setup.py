@@ -1,9 +1,18 @@
 from setuptools import setup, find_packages
 
+try:
+    # Optional: compile the framing fast path when Cython is available.
+    # The package is fully functional without it.
+    from Cython.Build import cythonize
+    ext_modules = cythonize(['rajant_api/_fastpath.pyx'])
+except ImportError:
+    ext_modules = []
+
 setup(
     name='rajant_api',
     version='0.1.1',
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[
         "grpcio==1.56.2",
         "grpcio-tools==1.56.2",
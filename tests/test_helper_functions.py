@@ -1,3 +1,4 @@
+import socket
 import unittest
 import rajant_api
 
@@ -6,17 +7,51 @@ class TestIsHostReachable(unittest.TestCase):
 
     def test_reachable_host(self):
         """
-        Test that the function returns True when the host is reachable.
+        Test that the function returns True when the host accepts the connection.
         """
-        # Use a known reachable host, such as "8.8.8.8" (Google's DNS server)
-        self.assertTrue(rajant_api.is_host_reachable("8.8.8.8"))
+        # Listen on an ephemeral local port so the probe has something to connect to
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen(1)
+            port = listener.getsockname()[1]
+            self.assertTrue(rajant_api.is_host_reachable("127.0.0.1", port))
+        finally:
+            listener.close()
 
     def test_unreachable_host(self):
         """
-        Test that the function returns False when the host is not reachable.
+        Test that the function returns False when nothing is listening on the port.
         """
-        # Use a known unreachable host
-        self.assertFalse(rajant_api.is_host_reachable("0.0.0.0"))
+        # Find a port with no listener by binding and immediately closing it
+        probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+        probe.close()
+        self.assertFalse(rajant_api.is_host_reachable("127.0.0.1", port))
+
+    def test_batch_reachability(self):
+        """
+        Test that the async batch helper probes all hosts and keys results by host.
+        """
+        import asyncio
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen(1)
+            port = listener.getsockname()[1]
+            result = asyncio.run(rajant_api.are_hosts_reachable(["127.0.0.1"], port))
+            self.assertEqual(result, {"127.0.0.1": True})
+        finally:
+            listener.close()
+
+    def test_batch_reachability_invalid_host(self):
+        """
+        Test that the async batch helper rejects invalid hosts up front.
+        """
+        import asyncio
+        with self.assertRaises(ValueError):
+            asyncio.run(rajant_api.are_hosts_reachable(["invalid_host"]))
 
     def test_invalid_host(self):
         """
@@ -46,6 +81,25 @@ class TestGPS(unittest.TestCase):
         }
         self.assertEqual(result, expected_result)
 
+    def test_gps_enabled_northern_western(self):
+        class state:  # Define a mock state object with the necessary attributes
+            class gps:
+                class gpsSwitch:
+                    enabled = True
+
+                class gpsPos:
+                    gpsLat = "2743.8950N"
+                    gpsLong = "02258.1429W"
+
+        result = rajant_api.helper_functions.get_gps(state)
+
+        expected_result = {
+            'enabled': True,
+            'latitude': 27.731583333333333,
+            'longitude': -22.969048333333333
+        }
+        self.assertEqual(result, expected_result)
+
     def test_gps_disabled(self):
         class state:  # Define a mock state object with the necessary attributes
             class gps:
@@ -91,11 +145,29 @@ class TestPackUnpackData(unittest.TestCase):
         packet = rajant_api.helper_functions.pack_data(data, gzip=False)
         self.assertEqual(rajant_api.helper_functions.unpack_data(packet), data)
 
+    def test_pack_data_skips_compression_for_small_payloads(self):
+        # Tiny payloads go out uncompressed (flag 0) even when gzip is requested
+        data = b"heartbeat"
+        packet = rajant_api.helper_functions.pack_data(data, gzip=True)
+        self.assertEqual(packet[4], 0)
+        self.assertEqual(rajant_api.helper_functions.unpack_data(packet), data)
+
+        # Payloads above the threshold are still compressed (flag 2)
+        data = b"x" * 1024
+        packet = rajant_api.helper_functions.pack_data(data, gzip=True)
+        self.assertEqual(packet[4], 2)
+        self.assertEqual(rajant_api.helper_functions.unpack_data(packet), data)
+
     def test_pack_data_with_invalid_input(self):
         # Test with non-bytes input
         with self.assertRaises(ValueError):
             rajant_api.helper_functions.pack_data("This is a string, not bytes", gzip=False)
 
+    def test_unpack_many(self):
+        payloads = [b"first", b"second" * 100, b""]
+        packets = [rajant_api.helper_functions.pack_data(p, gzip=i % 2 == 0) for i, p in enumerate(payloads)]
+        self.assertEqual(rajant_api.helper_functions.unpack_many(packets), payloads)
+
     def test_unpack_data_with_invalid_input(self):
         # Test with a packet that's too short
         with self.assertRaises(ValueError):
@@ -103,7 +175,12 @@ class TestPackUnpackData(unittest.TestCase):
 
         # Test with a packet that has an unknown compression flag
         with self.assertRaises(ValueError):
-            packet = b"\x00\x00\x00\x00\x01\x00\x00\x00" + b"This is some test data"
+            packet = b"\x00\x00\x00\x16\x01\x00\x00\x00" + b"This is some test data"
+            rajant_api.helper_functions.unpack_data(packet)
+
+        # Test with a packet whose declared length does not match the payload
+        with self.assertRaises(ValueError):
+            packet = b"\x00\x00\x00\x01\x00\x00\x00\x00" + b"This is some test data"
             rajant_api.helper_functions.unpack_data(packet)
 
 